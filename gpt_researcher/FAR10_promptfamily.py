@@ -1,7 +1,27 @@
-import warnings
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import time
 from datetime import date, datetime, timezone
-from typing import Callable, Dict, List, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, ClassVar, Dict, List, Mapping, Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+from jinja2 import DictLoader, Environment
 from langchain.docstore.document import Document
 
 # -----------------------------------------------------------------------------
@@ -20,14 +40,311 @@ from langchain.docstore.document import Document
 #       pass the plain string "FARPart10" directly into `get_prompt_family()`.
 
 
+# -----------------------------------------------------------------------------
+#  Cached prompt builders
+# -----------------------------------------------------------------------------
+#  Research loops frequently re-issue identical (question, parent_query,
+#  report_type, …) tuples during retries and multi-query expansion, so the
+#  heavy string formatting lives in module-level functions behind
+#  `lru_cache` — a repeated call is a dict lookup instead of re-interpolation.
+#  The public staticmethods below stay as thin wrappers so the API is
+#  unchanged; use `PromptFamily.clear_prompt_cache()` for test isolation.
+
+
+# Stable 64-bit key for a normalized research question.  Multi-query
+# retrieval issues several near-duplicate reformulations per session; outer
+# layers can key a shared LRU (or embedding-similarity cache) on this value
+# to skip the downstream LLM call entirely, not just the formatting.
+if HAS_XXHASH:
+    def _question_key(question: str) -> int:
+        return xxhash.xxh64(question.lower().strip()).intdigest()
+else:
+    def _question_key(question: str) -> int:
+        digest = hashlib.blake2b(question.lower().strip().encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+
+# Shared by both search-query builders.  Plain `+` concatenation over an
+# f-string for the two-operand case — same output, and the type-stable
+# module-level function gives the 3.11+ specializing interpreter a clean
+# target.
+def _compose_task(parent: str, q: str) -> str:
+    return parent + " - " + q if parent else q
+
+
+# The example stubs depend only on `max_iterations` (almost always 3), so a
+# tiny cache saturates immediately and the per-call join disappears even on
+# prompt-cache misses for fresh questions.
+@lru_cache(maxsize=8)
+def _default_example_stub(max_iterations: int) -> str:
+    return ", ".join([f'"query {i+1}"' for i in range(max_iterations)])
+
+
+@lru_cache(maxsize=8)
+def _far_example_template(max_iterations: int) -> str:
+    joined = FARPart10PromptFamily._JOINED_SOURCE_TEMPLATES.get(max_iterations)
+    if joined is None:
+        joined = ", ".join(FARPart10PromptFamily._SOURCE_TEMPLATES[:max_iterations])
+    return joined
+
+
+@lru_cache(maxsize=512)
+def _default_search_queries_prompt(question: str, parent_query: str, report_type: str,
+                                   max_iterations: int) -> str:
+    task = _compose_task(parent_query, question)
+    dynamic_example = _default_example_stub(max_iterations)
+    return (
+        f"Write {max_iterations} web search queries to learn about: \"{task}\".\n"
+        f"Return a Python list → [{dynamic_example}] only."
+    )
+
+
+# %-formatted report skeletons: the format string is parsed once at import
+# and lives in the constants pool, so a cache miss only pays the
+# substitutions instead of re-running the f-string BUILD_STRING chain.
+_DEFAULT_REPORT_TMPL = (
+    "Information gathered: \"%s\"\n---\n"
+    "Using that information, draft a %d+ word report answering: \"%s\".\n"
+    "• Use markdown + %s citations.\n"
+    "• %s\n"
+    "• Language: %s.\n"
+)
+
+# Named %(slot)s placeholders keep the skeleton readable as it grows and let
+# the builder substitute from a small dict in one pass.
+_FAR_REPORT_TMPL = (
+    "Information collected: \n\"%(context)s\"\n---\n"
+    "Draft a concise FAR Part 10 market research report (≥%(total_words)d words) addressing: \"%(question)s\".\n"
+    "Required elements:\n"
+    "1. Potential sources and their socio‑economic status (e.g., Small, 8(a), HUBZone).\n"
+    "2. Contract vehicles (GSA schedules, BPAs, IDIQs) where the requirement could be placed.\n"
+    "3. Recent relevant contract awards with pricing data.\n"
+    "4. Assessment of competition & capability.\n"
+    "5. Recommendation (adequate competition? set‑aside feasible?).\n"
+    "• Use markdown + %(report_format)s citations.\n"
+    "• %(tone_clause)s  • %(source_clause)s\n"
+    "• Date: %(today)s.  Language: %(language)s."
+)
+
+
+# Header/footer splits around the context slot for the streaming variants —
+# the context (often tens of KB of RAG chunks) is passed through by
+# reference instead of being copied into the finished prompt.
+_DEFAULT_REPORT_HEADER, _DEFAULT_REPORT_FOOTER_TMPL = _DEFAULT_REPORT_TMPL.split("%s", 1)
+_FAR_REPORT_HEADER, _FAR_REPORT_FOOTER_TMPL = _FAR_REPORT_TMPL.split("%(context)s", 1)
+
+
+class StreamedReportPrompt:
+    """A report prompt as (header, context, footer) without concatenation.
+
+    Iterate it (e.g. into an httpx streaming request body) or call
+    `write_to(fp)` to emit the three segments in order; `str()` materializes
+    the full prompt when a caller still needs one string.
+    """
+
+    __slots__ = ("header", "context", "footer")
+
+    def __init__(self, header: str, context: str, footer: str):
+        self.header = header
+        self.context = context
+        self.footer = footer
+
+    def __iter__(self):
+        yield self.header
+        yield self.context
+        yield self.footer
+
+    def write_to(self, fp) -> None:
+        write = fp.write
+        write(self.header)
+        write(self.context)
+        write(self.footer)
+
+    def __str__(self) -> str:
+        return self.header + self.context + self.footer
+
+
+# Pre-encoded skeletons for the bytes-emitting report variants: the static
+# prose is UTF-8 encoded once at import, so per call only the variable slots
+# pay an encoding pass and the downstream client can POST the result as-is.
+_DEFAULT_REPORT_TMPL_B = _DEFAULT_REPORT_TMPL.encode("utf-8")
+_FAR_REPORT_TMPL_B = _FAR_REPORT_TMPL.encode("utf-8")
+
+
+@lru_cache(maxsize=512)
+def _default_report_prompt(question: str, context: str, report_source: str,
+                           report_format: str, total_words: int,
+                           tone: str | None, language: str) -> str:
+    tone_clause = f"Write in a {tone} tone." if tone else ""
+    return _DEFAULT_REPORT_TMPL % (context, total_words, question,
+                                   report_format.upper(), tone_clause, language)
+
+
+@lru_cache(maxsize=512)
+def _far_search_queries_prompt(question: str, parent_query: str, report_type: str,
+                               max_iterations: int) -> str:
+    task = _compose_task(parent_query, question)
+
+    gov_hint = FARPart10PromptFamily._GOV_HINT
+    dynamic_example = _far_example_template(max_iterations).format(task=task)
+
+    return (
+        f"You are performing FAR Part 10 market research.  Generate up to {max_iterations} highly‑targeted “site:” or keyword queries that will surface contractor information from these primary systems first: {gov_hint}.  \n"
+        f"Task: \"{task}\". Return ONLY a Python list, e.g. [{dynamic_example}]."
+    )
+
+
+# orjson serializes nested dict/list structures several times faster than
+# stdlib json — use it for the tool-selection payloads when installed.
+if HAS_ORJSON:
+    def _json_canonical(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+
+    def _json_pretty(s: str) -> str:
+        return orjson.dumps(orjson.loads(s), option=orjson.OPT_INDENT_2).decode()
+else:
+    def _json_canonical(obj: Any) -> str:
+        return json.dumps(obj, sort_keys=True)
+
+    def _json_pretty(s: str) -> str:
+        return json.dumps(json.loads(s), indent=2)
+
+
+# The tool-selection prose is identical across calls except for the query,
+# the tools payload and `max_tools` — keep the static segments as constants
+# and assemble with a single fixed-size "".join.
+_FAR_TOOL_LANG = (
+    "When selecting tools, prefer those that query authoritative government acquisition data sets (GSA, FPDS, USAspending, SBA DSBS) before generic web search utilities."
+)
+_TOOL_HEADER = (
+    "You are a FAR Part 10 market‑research assistant.  " + _FAR_TOOL_LANG
+    + "\n\nRESEARCH QUERY: \""
+)
+_TOOL_MID = "\"\n\nAVAILABLE TOOLS:\n"
+
+
+@lru_cache(maxsize=8)
+def _tool_tail(max_tools: int) -> str:
+    return (
+        f"\n\nSelect EXACTLY {max_tools} tools best suited to gather competitive sourcing information."
+        "  Return the JSON object described below."
+    )
+
+
+@lru_cache(maxsize=512)
+def _far_tool_selection_prompt(query: str, tools_key: str, max_tools: int) -> str:
+    # `tools_key` is the canonical sorted-keys JSON dump computed by the
+    # wrapper — it doubles as the cache key for the otherwise unhashable
+    # tools list.
+    return "".join((_TOOL_HEADER, query, _TOOL_MID, _json_pretty(tools_key), _tool_tail(max_tools)))
+
+
+# The FAR report body renders through a Jinja2 template compiled once at
+# import: the tone/source conditionals become plain `if`s in the generated
+# code and the static prose is constant-folded, so a render is a single
+# function call.  (% skeleton above is still the source of truth for the
+# bytes and streaming variants.)
+_FAR_REPORT_JINJA_SRC = (
+    "Information collected: \n\"{{ context }}\"\n---\n"
+    "Draft a concise FAR Part 10 market research report (≥{{ total_words }} words) addressing: \"{{ question }}\".\n"
+    "Required elements:\n"
+    "1. Potential sources and their socio‑economic status (e.g., Small, 8(a), HUBZone).\n"
+    "2. Contract vehicles (GSA schedules, BPAs, IDIQs) where the requirement could be placed.\n"
+    "3. Recent relevant contract awards with pricing data.\n"
+    "4. Assessment of competition & capability.\n"
+    "5. Recommendation (adequate competition? set‑aside feasible?).\n"
+    "• Use markdown + {{ report_format }} citations.\n"
+    "• {% if tone %}Write in a {{ tone }} tone.{% endif %}"
+    "  • {% if report_source == 'web' %}List contract numbers & links from each cited system at the end.{% endif %}\n"
+    "• Date: {{ today }}.  Language: {{ language }}."
+)
+
+_JINJA_ENV = Environment(loader=DictLoader({"far_report": _FAR_REPORT_JINJA_SRC}),
+                         auto_reload=False, cache_size=64, optimized=True)
+_FAR_REPORT_JINJA = _JINJA_ENV.get_template("far_report")
+
+
+@lru_cache(maxsize=512)
+def _far_report_prompt(question: str, context: str, report_source: str,
+                       report_format: str, total_words: int,
+                       tone: str | None, language: str, today: date) -> str:
+    return _FAR_REPORT_JINJA.render(
+        context=context,
+        total_words=total_words,
+        question=question,
+        report_format=report_format.upper(),
+        tone=tone,
+        report_source=report_source,
+        today=today,
+        language=language,
+    )
+
+
+# `date.today()` costs a syscall plus object construction per call; batch
+# report runs hit it constantly for the same day, so amortize it behind a
+# 60-second TTL.
+_TODAY_CACHE: Dict[str, Any] = {"t": 0.0, "d": None}
+
+
+def _cached_today() -> date:
+    now = time.monotonic()
+    if _TODAY_CACHE["d"] is None or now - _TODAY_CACHE["t"] > 60:
+        _TODAY_CACHE["d"] = date.today()
+        _TODAY_CACHE["t"] = now
+    return _TODAY_CACHE["d"]
+
+
+_CACHED_PROMPT_BUILDERS = (
+    _default_search_queries_prompt,
+    _default_report_prompt,
+    _far_search_queries_prompt,
+    _far_tool_selection_prompt,
+    _far_report_prompt,
+)
+
+
+# Minimal mapping (only the types we kept) — lives above the classes so the
+# dispatch tables below can be built at class-definition time.
+report_type_mapping = {
+    "ResearchReport": "generate_report_prompt",
+}
+
+
 class PromptFamily:
     """Lightweight, model‑agnostic prompt helpers."""
 
+    # ------------------------------------------------------------------
+    # Report-type dispatch
+    # ------------------------------------------------------------------
+    # One {report_type: function} table per class, frozen when the class is
+    # created, so `get_prompt_by_report_type` is a single dict probe instead
+    # of a mapping lookup plus a getattr MRO walk per call.
+    _REPORT_DISPATCH: ClassVar[Dict[str, Callable]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._REPORT_DISPATCH = {rt: getattr(cls, name) for rt, name in report_type_mapping.items()}
+
     # ------------------------------------------------------------------
     # Construction
     # ------------------------------------------------------------------
+    # Fixed-offset attribute storage: no per-instance __dict__, and the
+    # dispatch shortcuts below resolve as slot loads instead of an MRO walk
+    # through the staticmethod descriptors on every hot-path call.
+    __slots__ = ("cfg", "search", "report", "tool_select")
+
     def __init__(self, cfg: "Config" | None = None):
         self.cfg = cfg  # cfg may be None for simple scripts
+        cls = type(self)
+        self.search = cls.generate_search_queries_prompt
+        self.report = cls.generate_report_prompt
+        self.tool_select = getattr(cls, "generate_mcp_tool_selection_prompt", None)
+
+    @classmethod
+    def clear_prompt_cache(cls) -> None:
+        """Drop every memoized prompt — call between tests for isolation."""
+        for builder in _CACHED_PROMPT_BUILDERS:
+            builder.cache_clear()
 
     # ------------------------------------------------------------------
     # Generic helpers (kept minimal)
@@ -35,10 +352,21 @@ class PromptFamily:
     @staticmethod
     def pretty_print_docs(docs: List[Document], top_n: int | None = None) -> str:
         """Compact document list → plain‑text context"""
-        return "\n".join(
-            f"Source: {d.metadata.get('source')}\nTitle: {d.metadata.get('title')}\nContent: {d.page_content}"
-            for i, d in enumerate(docs) if top_n is None or i < top_n
-        )
+        # Bind `d.metadata` once per doc and hand join() a materialized list
+        # so it can size the result in a single pass — RAG contexts routinely
+        # hold hundreds of chunks.  `top_n is None` is the common case, so it
+        # gets a tighter loop without the enumerate/index machinery.
+        if top_n is None:
+            return "\n".join([
+                f"Source: {(m := d.metadata).get('source')}\nTitle: {m.get('title')}\nContent: {d.page_content}"
+                for d in docs
+            ])
+        docs = docs[:top_n]
+        parts = [None] * len(docs)
+        for i, d in enumerate(docs):
+            m = d.metadata
+            parts[i] = f"Source: {m.get('source')}\nTitle: {m.get('title')}\nContent: {d.page_content}"
+        return "\n".join(parts)
 
     # ------------------------------------------------------------------
     # ***** PUBLIC API – methods expected by the rest of GPT‑Researcher *****
@@ -47,26 +375,58 @@ class PromptFamily:
     def generate_search_queries_prompt(question: str, parent_query: str, report_type: str,
                                         max_iterations: int = 3, context: List[Dict[str, Any]] | None = None) -> str:
         """Default Google‑style search query generator (vanilla)."""
-        task = f"{parent_query} - {question}" if parent_query else question
-        dynamic_example = ", ".join([f'"query {i+1}"' for i in range(max_iterations)])
-        return (
-            f"Write {max_iterations} web search queries to learn about: \"{task}\".\n"
-            f"Return a Python list → [{dynamic_example}] only."
-        )
+        return _default_search_queries_prompt(question, parent_query, report_type, max_iterations)
+
+    @classmethod
+    def generate_search_queries_prompt_with_key(cls, question: str, parent_query: str, report_type: str,
+                                                max_iterations: int = 3,
+                                                context: List[Dict[str, Any]] | None = None) -> tuple[str, int]:
+        """`generate_search_queries_prompt` plus a stable cache key.
+
+        The key hashes the normalized question so callers can short-circuit
+        the whole LLM round-trip for near-duplicate questions, not just the
+        prompt formatting.
+        """
+        prompt = cls.generate_search_queries_prompt(question, parent_query, report_type,
+                                                    max_iterations, context)
+        return prompt, _question_key(question)
 
     @staticmethod
     def generate_report_prompt(question: str, context: str, report_source: str,
                                report_format: str = "apa", total_words: int = 1000,
                                tone: str | None = None, language: str = "english") -> str:
         """Simple markdown/APA report template."""
+        return _default_report_prompt(question, context, report_source,
+                                      report_format, total_words, tone, language)
+
+    @staticmethod
+    def generate_report_prompt_bytes(question: str, context: str, report_source: str,
+                                     report_format: str = "apa", total_words: int = 1000,
+                                     tone: str | None = None, language: str = "english") -> bytes:
+        """`generate_report_prompt` rendered straight to UTF-8 bytes.
+
+        Saves the downstream `str.encode()` pass when the LLM client ships
+        the prompt over the wire anyway.
+        """
+        tone_clause = f"Write in a {tone} tone." if tone else ""
+        return _DEFAULT_REPORT_TMPL_B % (context.encode(), total_words, question.encode(),
+                                         report_format.upper().encode(),
+                                         tone_clause.encode(), language.encode())
+
+    @staticmethod
+    def generate_report_prompt_stream(question: str, context: str, report_source: str,
+                                      report_format: str = "apa", total_words: int = 1000,
+                                      tone: str | None = None, language: str = "english") -> StreamedReportPrompt:
+        """`generate_report_prompt` without copying `context` into the result."""
         tone_clause = f"Write in a {tone} tone." if tone else ""
-        return (
-            f"Information gathered: \"{context}\"\n---\n"
-            f"Using that information, draft a {total_words}+ word report answering: \"{question}\".\n"
-            f"• Use markdown + {report_format.upper()} citations.\n"
-            f"• {tone_clause}\n"
-            f"• Language: {language}.\n"
-        )
+        footer = _DEFAULT_REPORT_FOOTER_TMPL % (total_words, question, report_format.upper(),
+                                                tone_clause, language)
+        return StreamedReportPrompt(_DEFAULT_REPORT_HEADER, context, footer)
+
+
+# `__init_subclass__` only fires for subclasses — seed the base table here.
+PromptFamily._REPORT_DISPATCH = {rt: getattr(PromptFamily, name)
+                                 for rt, name in report_type_mapping.items()}
 
 
 # -----------------------------------------------------------------------------
@@ -75,14 +435,29 @@ class PromptFamily:
 class FARPart10PromptFamily(PromptFamily):
     """Prompts curated for Contracting Officers & Specialists performing FAR 10 market research."""
 
-    # Key government sources – used in examples & reasoning
-    _PRIMARY_SOURCES = [
+    __slots__ = ()  # keep instances dict-free like the base class
+
+    # Key government sources – used in examples & reasoning.  Interned so
+    # downstream dict/set membership and equality checks on these names hit
+    # the identity fast path (multi-word literals are not auto-interned).
+    _PRIMARY_SOURCES = [sys.intern(s) for s in (
         "GSA eLibrary",
         "GSA Advantage",
         "USAspending.gov",
         "SBA Dynamic Small Business Search (DSBS)",
         "Federal Procurement Data System (FPDS)"
-    ]
+    )]
+
+    # Derived constants, folded at class-definition time — `_PRIMARY_SOURCES`
+    # is immutable class data, so none of these joins need to run per call.
+    _GOV_HINT: ClassVar[str] = ", ".join(_PRIMARY_SOURCES)
+    _SOURCE_TEMPLATES: ClassVar[tuple[str, ...]] = tuple(f'"{s} {{task}}"' for s in _PRIMARY_SOURCES)
+    # Pre-joined example templates for every valid `max_iterations`; only the
+    # `{task}` slots remain to be filled at call time.
+    _JOINED_SOURCE_TEMPLATES: ClassVar[Dict[int, str]] = {}
+    for _k in range(1, len(_PRIMARY_SOURCES) + 1):
+        _JOINED_SOURCE_TEMPLATES[_k] = ", ".join(_SOURCE_TEMPLATES[:_k])
+    del _k
 
     # ----------------------------------------------
     # Search‑query generation (override)
@@ -91,15 +466,7 @@ class FARPart10PromptFamily(PromptFamily):
     def generate_search_queries_prompt(question: str, parent_query: str, report_type: str,
                                         max_iterations: int = 3, context: List[Dict[str, Any]] | None = None) -> str:
         """Craft queries that target the *authoritative* federal data sources first."""
-        task = f"{parent_query} - {question}" if parent_query else question
-
-        gov_hint = ", ".join(FARPart10PromptFamily._PRIMARY_SOURCES)
-        dynamic_example = ", ".join([f'"{s} {task}"' for s in FARPart10PromptFamily._PRIMARY_SOURCES[:max_iterations]])
-
-        return (
-            f"You are performing FAR Part 10 market research.  Generate up to {max_iterations} highly‑targeted “site:” or keyword queries that will surface contractor information from these primary systems first: {gov_hint}.  \n"
-            f"Task: \"{task}\". Return ONLY a Python list, e.g. [{dynamic_example}]."
-        )
+        return _far_search_queries_prompt(question, parent_query, report_type, max_iterations)
 
     # ----------------------------------------------
     # Tool‑selection prompt (override)
@@ -107,17 +474,8 @@ class FARPart10PromptFamily(PromptFamily):
     @staticmethod
     def generate_mcp_tool_selection_prompt(query: str, tools_info: List[Dict[str, Any]], max_tools: int = 3) -> str:
         """Bias selection toward FAR‑relevant tools (GSA, USAspending, etc.)."""
-        # Re‑use parent logic but insert FAR criterion
-        import json
-        far_lang = (
-            "When selecting tools, prefer those that query authoritative government acquisition data sets (GSA, FPDS, USAspending, SBA DSBS) before generic web search utilities."
-        )
-        return (
-            f"You are a FAR Part 10 market‑research assistant.  {far_lang}\n\n"
-            f"RESEARCH QUERY: \"{query}\"\n\n"
-            f"AVAILABLE TOOLS:\n{json.dumps(tools_info, indent=2)}\n\n"
-            f"Select EXACTLY {max_tools} tools best suited to gather competitive sourcing information.  Return the JSON object described below."
-        )
+        tools_key = _json_canonical(tools_info)
+        return _far_tool_selection_prompt(query, tools_key, max_tools)
 
     # ----------------------------------------------
     # Report prompt (override)
@@ -127,22 +485,45 @@ class FARPart10PromptFamily(PromptFamily):
                                report_format: str = "apa", total_words: int = 800,
                                tone: str | None = "objective", language: str = "english") -> str:
         """FAR‑aligned report (sources, competition, socio‑econ, etc.)."""
-        today = date.today()
+        today = _cached_today()
+        return _far_report_prompt(question, context, report_source,
+                                  report_format, total_words, tone, language, today)
+
+    @staticmethod
+    def generate_report_prompt_bytes(question: str, context: str, report_source: str,
+                                     report_format: str = "apa", total_words: int = 800,
+                                     tone: str | None = "objective", language: str = "english") -> bytes:
+        """FAR report rendered straight to UTF-8 bytes (see base class)."""
+        tone_clause = f"Write in a {tone} tone." if tone else ""
+        source_clause = "List contract numbers & links from each cited system at the end." if report_source == "web" else ""
+        return _FAR_REPORT_TMPL_B % {
+            b"context": context.encode(),
+            b"total_words": total_words,
+            b"question": question.encode(),
+            b"report_format": report_format.upper().encode(),
+            b"tone_clause": tone_clause.encode(),
+            b"source_clause": source_clause.encode(),
+            b"today": str(_cached_today()).encode(),
+            b"language": language.encode(),
+        }
+
+    @staticmethod
+    def generate_report_prompt_stream(question: str, context: str, report_source: str,
+                                      report_format: str = "apa", total_words: int = 800,
+                                      tone: str | None = "objective", language: str = "english") -> StreamedReportPrompt:
+        """FAR report without copying `context` into the result (see base class)."""
         tone_clause = f"Write in a {tone} tone." if tone else ""
         source_clause = "List contract numbers & links from each cited system at the end." if report_source == "web" else ""
-        return (
-            f"Information collected: \n\"{context}\"\n---\n"
-            f"Draft a concise FAR Part 10 market research report (≥{total_words} words) addressing: \"{question}\".\n"
-            f"Required elements:\n"
-            f"1. Potential sources and their socio‑economic status (e.g., Small, 8(a), HUBZone).\n"
-            f"2. Contract vehicles (GSA schedules, BPAs, IDIQs) where the requirement could be placed.\n"
-            f"3. Recent relevant contract awards with pricing data.\n"
-            f"4. Assessment of competition & capability.\n"
-            f"5. Recommendation (adequate competition? set‑aside feasible?).\n"
-            f"• Use markdown + {report_format.upper()} citations.\n"
-            f"• {tone_clause}  • {source_clause}\n"
-            f"• Date: {today}.  Language: {language}."
-        )
+        footer = _FAR_REPORT_FOOTER_TMPL % {
+            "total_words": total_words,
+            "question": question,
+            "report_format": report_format.upper(),
+            "tone_clause": tone_clause,
+            "source_clause": source_clause,
+            "today": _cached_today(),
+            "language": language,
+        }
+        return StreamedReportPrompt(_FAR_REPORT_HEADER, context, footer)
 
 
 # -----------------------------------------------------------------------------
@@ -152,28 +533,38 @@ class FARPart10PromptFamily(PromptFamily):
 # Signature for report‑generator methods the rest of the repo expects
 PROMPT_GENERATOR = Callable[[str, str, str, str, str | None, int, str], str]
 
-# Minimal mapping (only the types we kept)
-report_type_mapping = {
-    "ResearchReport": "generate_report_prompt",
-}
-
-
 def get_prompt_by_report_type(report_type: str, prompt_family: PromptFamily) -> PROMPT_GENERATOR:
-    method_name = report_type_mapping.get(report_type, "generate_report_prompt")
-    return getattr(prompt_family, method_name)
+    cls = type(prompt_family)
+    return cls._REPORT_DISPATCH.get(report_type, cls.generate_report_prompt)
 
 
 # ----------------------------- Prompt‑family registry ------------------------
 # NOTE:  If you have a real PromptFamilyEnum, map its .value strings here.
-prompt_family_mapping: Dict[str, type[PromptFamily]] = {
+# Frozen so accidental mutation fails loudly and attribute caches stay stable.
+prompt_family_mapping: Mapping[str, type[PromptFamily]] = MappingProxyType({
     "Default": PromptFamily,
     "FARPart10": FARPart10PromptFamily,
+})
+
+# Families are stateless without a config, so the common `config is None`
+# case reuses one shared instance per family instead of allocating.
+_INSTANCES_NO_CFG: Dict[str, PromptFamily] = {
+    name: cls(None) for name, cls in prompt_family_mapping.items()
 }
 
 
 def get_prompt_family(name: str, config: "Config" | None = None) -> PromptFamily:
     """Retrieve the requested prompt family; fall back to Default."""
-    cls = prompt_family_mapping.get(name, PromptFamily)
-    if name not in prompt_family_mapping:
+    if config is None:
+        instance = _INSTANCES_NO_CFG.get(name)
+        if instance is not None:
+            return instance
+        import warnings  # deferred — only the unknown-family branch pays for it
+        warnings.warn(f"Unknown prompt family '{name}', using Default.")
+        return _INSTANCES_NO_CFG["Default"]
+    cls = prompt_family_mapping.get(name)
+    if cls is None:
+        import warnings
         warnings.warn(f"Unknown prompt family '{name}', using Default.")
+        cls = PromptFamily
     return cls(config)